@@ -8,8 +8,22 @@ from dotenv import load_dotenv
 from src.orchestrator import MatchingOrchestrator
 import traceback
 import sys
+import orjson
 import yaml
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    # libyaml not available - pure Python emitter
+    from yaml import SafeDumper as YamlDumper
+
+try:
+    import uvloop
+    new_event_loop = uvloop.new_event_loop
+except ImportError:
+    # uvloop is unavailable on Windows - fall back to the stdlib loop
+    new_event_loop = asyncio.new_event_loop
+
 # Load env file
 load_dotenv()
 
@@ -17,33 +31,57 @@ load_dotenv()
 # Utils
 # ---------------------------------------------------------------------
 # Formatting
-def to_yaml(obj) -> str:
-    if hasattr(obj, "model_dump"):
-        obj = obj.model_dump()
+def to_yaml(data) -> str:
+    # Expects JSON-mode data (model_dump(mode="json") / orjson) - plain types only, so no custom representers
     return yaml.dump(
-        obj,
+        data,
+        Dumper=YamlDumper,
         indent=4,
         sort_keys=False,
         allow_unicode=True,
         default_flow_style=False,
     )
 
+# Shared across sessions - bounded so old reports are evicted; holds no PII (candidate details are dumped uncached)
+@st.cache_data(show_spinner=False, max_entries=64, ttl=60 * 60)
+def yaml_of(model_json: str) -> str:
+    """
+    YAML of a serialised model, cached on its JSON so reruns don't redump unchanged models.
+    """
+    return to_yaml(orjson.loads(model_json))
+
 def progress_update(message: str):
     status_placeholder.markdown(f"**{message}**")
 
 
-# Async helper
+# Async helpers
+def session_event_loop():
+    """
+    Event loop for this session - reused rather than created per click.
+    """
+    loop = st.session_state.get("event_loop")
+    if loop is None or loop.is_closed():
+        loop = new_event_loop()
+        st.session_state.event_loop = loop
+    asyncio.set_event_loop(loop)
+    return loop
+
 def run_async(coroutine):
     """
     Safely run async code inside Streamlit.
     """
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    return session_event_loop().run_until_complete(coroutine)
 
-    return loop.run_until_complete(coroutine)
+def run_async_iter(async_iterator):
+    """
+    Drive an async iterator from Streamlit's sync script, e.g. for st.write_stream.
+    """
+    loop = session_event_loop()
+    while True:
+        try:
+            yield loop.run_until_complete(async_iterator.__anext__())
+        except StopAsyncIteration:
+            break
 
 # Traceability
 def excepthook(exc_type, exc, tb):
@@ -146,7 +184,7 @@ if st.session_state.report is not None:
         left, right = st.columns([3, 1])
         with left:
             st.subheader("Candidate Details")
-            st.code(to_yaml(report.candidate_details), language="yaml")
+            st.code(to_yaml(report.candidate_details.model_dump(mode="json")), language="yaml")
 
             st.write(f'''**Summary Version** : {st.session_state.summary_version}''')
             st.write(st.session_state.current_summary)
@@ -165,33 +203,30 @@ if st.session_state.report is not None:
             if not recruiter_feedback.strip():
                 st.warning("Please add comments before regenerating.")
             else:
-                with st.spinner("Re-generating summary with recruiter input"):
-                    updated_summary = run_async(
-                        st.session_state.orchestrator.regenerate_summary(
-                            report=st.session_state.report,
-                            recruiter_feedback=recruiter_feedback
+                with left:
+                    # Stream the new version below the current one
+                    st.write(f'''**Summary Version** : {st.session_state.summary_version + 1}''')
+                    st.write_stream(
+                        run_async_iter(
+                            st.session_state.orchestrator.stream_regenerated_summary(
+                                report=st.session_state.report,
+                                recruiter_feedback=recruiter_feedback
+                            )
                         )
                     )
-                st.session_state.report.summary = updated_summary
-                st.session_state.current_summary = updated_summary.summary
-                # st.session_state.report.summary.summary = updated_summary
-                # st.session_state.current_summary = updated_summary
-                st.session_state.summary_version += 1
-            with left:
-                    # Update with new values
-                    st.write(f'''**Summary Version** : {st.session_state.summary_version}''')
-                    st.write(st.session_state.current_summary)
+                    st.session_state.current_summary = st.session_state.report.summary.summary
+                    st.session_state.summary_version += 1
 
                     st.success("Summary updated")
 
     with tab2:
         st.subheader("Fit Analysis")
-        st.code(to_yaml(report.fit_analysis), language="yaml")
+        st.code(yaml_of(report.fit_analysis.model_dump_json()), language="yaml")
 
     with tab3:
         st.subheader("Parsed Resume")
-        st.code(to_yaml(report.resume), language="yaml")
+        st.code(yaml_of(report.resume.model_dump_json()), language="yaml")
 
     with tab4:
         st.subheader("Parsed Job Description")
-        st.code(to_yaml(report.job), language="yaml")
+        st.code(yaml_of(report.job.model_dump_json()), language="yaml")
@@ -0,0 +1,90 @@
+"""
+Single factory for the Pydantic AI agents, keyed by role (LLM_MODELS key).
+Every agent is built the same way - shared HTTP client, versioned prompt, role tools and output schema.
+"""
+from functools import lru_cache
+from pydantic_ai import Agent
+from pydantic_ai.tools import Tool
+from pydantic_ai.settings import ModelSettings
+
+from src.config import LLM_MODELS
+from src.utils.llm_client import build_model
+from src.utils.prompt_loader import load_agent_prompt
+from src.models import ParsedResume, ParsedJob, FitAnalysis, SummaryGenerated
+from src.tools.parse_dates_and_duration import parse_dates_and_duration
+from src.tools.nli_entailment import nli_entailment_batch_tool
+from src.tools.skill_evaluator import evaluate_skills_batch
+from src.tools.experience_evaluator import score_experience_years, score_experience_kinds_batch, combine_experience_scores
+from src.tools.education_evaluator import score_education_and_qualification
+from src.tools.overall_scoring import compute_overall_fit_score
+
+# Role -> structured output
+OUTPUT_TYPES = {
+    "resume_parser": ParsedResume,
+    "job_parser": ParsedJob,
+    "matcher": FitAnalysis,
+    "summary": SummaryGenerated,
+}
+
+# Role -> tools
+TOOLS = {
+    "resume_parser": [
+        Tool(
+            parse_dates_and_duration,
+            name="parse_dates_and_duration",
+            description="Parse dates and compute duration in months and years.",
+        ),
+        Tool(
+            nli_entailment_batch_tool,
+            name="nli_entailment_check",
+            description="Check whether each evidence snippet entails its factual hypothesis - pass all claims for an entity type in one call.",
+        ),
+    ],
+    "job_parser": [
+        Tool(
+            nli_entailment_batch_tool,
+            name="nli_entailment_check",
+            description="Check whether each evidence snippet entails its factual job requirement - pass all claims for an entity type in one call.",
+        )
+    ],
+    "matcher": [
+        Tool(evaluate_skills_batch, name="evaluate_skills_batch", description="Evaluate lexical and semantic match of ALL ad skills against candidate skills in one call. Returns per skill classification: match | transferable | missing (with similarity)."),
+        Tool(score_experience_years, name="score_experience_years", description="Deterministic score to evaluate candidate experience years match to ad requirement"),
+        Tool(score_experience_kinds_batch, name="score_experience_kinds_batch", description="Lexical and semantic match of ALL ad experience fields against candidate experience in one call"),
+        Tool(combine_experience_scores, name="combine_experience_scores", description="Combine years + kind"),
+        Tool(score_education_and_qualification, name="score_education_and_qualification", description="Use to evaluate lexical and semantic match of ad and candidate education and qualifications."),
+        Tool(compute_overall_fit_score, name="compute_overall_fit_score", description="Weighted overall score combining required and prefered skills, experience, education, and qualifications."),
+    ],
+    "summary": [],
+}
+
+
+@lru_cache(maxsize=None)
+def make_agent(role: str) -> Agent:
+    """
+    Build (once per process) the agent for a role.
+
+    Args:
+        role: LLM_MODELS key - resume_parser | job_parser | matcher | summary
+
+    Returns:
+        Pydantic AI Agent with the role's prompt, tools and structured output
+    """
+    model = LLM_MODELS[role]
+
+    model_settings = ModelSettings(temperature=model.temperature, seed=42)
+    if model.max_tokens is not None:
+        model_settings["max_tokens"] = model.max_tokens
+    # Lets the model emit several tool calls per turn - Pydantic AI runs them concurrently
+    if model.parallel_tool_calls is not None:
+        model_settings["parallel_tool_calls"] = model.parallel_tool_calls
+
+    return Agent(
+        build_model(model),
+        output_type=OUTPUT_TYPES[role],
+        system_prompt=load_agent_prompt(role),
+        tools=TOOLS[role],
+        model_settings=model_settings,
+        retries=3,
+        output_retries=3
+    )
@@ -2,46 +2,64 @@
 Matching agent with semantic matching tools.
 
 Flow:
-1. Uses semantic_matcher tool to get skill matches (exact + transferable)
+1. Uses evaluate_skills_batch tool to get all skill matches (exact + transferable) in one call
 2. Uses semantic_matcher tool to score experience
 3. LLM analyses seniority, strengths, overall fit
 """
-from pathlib import Path
-from pydantic_ai import Agent
-from pydantic_ai.tools import Tool
-from pydantic_ai.settings import ModelSettings
-
-from src.config import LLM_MODELS
+import asyncio
+import orjson
+from typing import List
+from pydantic import BaseModel
+from src.agents.agent_factory import make_agent
+from src.config import CONTEXT_BUDGET
 from src.models import ParsedResume, ParsedJob, FitAnalysis
-from src.tools.skill_evaluator import evaluate_single_skill
-from src.tools.experience_evaluator import *
-from src.tools.education_evaluator import score_education_and_qualification
-from src.tools.overall_scoring import compute_overall_fit_score
+from src.utils.embedding_model import warm_up_models
+from src.utils.embedding_cache import encode_cached, normalise_text
+
+# Create Pydantic AI agent with structured output for candidate fit analysis
+matcher_agent = make_agent("matcher")
 
-model = LLM_MODELS["matcher"]
+# Load tool models off the critical path - ready by the time the matcher's first tool call lands
+warm_up_models()
 
-# Load prompt
-PROMPT_PATH = Path(__file__).parent.parent / "prompts" / model.prompt_version / "fit_analyser_prompt.txt"
-MATCHER_PROMPT = PROMPT_PATH.read_text()
 
+def _trim_evidence(data):
+    """Truncate every evidence_text in a dumped model to the context budget"""
+    if isinstance(data, dict):
+        return {
+            k: v[:CONTEXT_BUDGET.evidence_chars] if k == "evidence_text" and isinstance(v, str) else _trim_evidence(v)
+            for k, v in data.items()
+        }
+    if isinstance(data, list):
+        return [_trim_evidence(v) for v in data]
+    return data
 
-# Create Pydantic AI agent with structured output for candidate fit analysis
-matcher_agent = Agent(
-    model.name,
-    output_type=FitAnalysis,
-    system_prompt=MATCHER_PROMPT,
-     tools=[
-        Tool(evaluate_single_skill, name="evaluate_single_skill", description="Evaluate lexical and semantic match of ad and candidate skills. Returns classification: match | transferable | missing (with similarity)."),
-        Tool(score_experience_years, name="score_experience_years", description="Deterministic score to evaluate candidate experience years match to ad requirement"),
-        Tool(score_experience_kind, name="score_experience_kind", description="Lexical and semantic match to evaluate candidate experience field match to ad requirement"),
-        Tool(combine_experience_scores, name="combine_experience_scores", description="Combine years + kind"),
-        Tool(score_education_and_qualification, name="score_education_and_qualification", description="Use to evaluate lexical and semantic match of ad and candidate education and qualifications."),
-        Tool(compute_overall_fit_score, name="compute_overall_fit_score", description="Weighted overall score combining required and prefered skills, experience, education, and qualifications."),
-    ],
-    model_settings=ModelSettings(temperature=model.temperature, seed=42),
-    retries=3,
-    output_retries=3
-)
+
+def _context_json(model: BaseModel, exclude: set = None) -> str:
+    """Compact JSON of a model for the matcher prompt, with evidence snippets trimmed"""
+    data = model.model_dump(mode="json", exclude_none=True, exclude=exclude)
+    return orjson.dumps(_trim_evidence(data)).decode()
+
+
+def precompute_job_embeddings(job: ParsedJob) -> None:
+    """
+    Encode every job-side text the matcher tools will query (skills, experience kind,
+    education, qualifications) in one batch, into the shared embedding cache.
+    Tool calls for this job - and for every later candidate against it - then hit the cache.
+
+    Args:
+        job: Parsed job description
+    """
+    texts: List[str] = [*job.required_skills, *job.preferred_skills, *job.other_qualifications]
+    texts += [t for t in (job.required_experience_kind, job.education_requirement) if t]
+    texts = [normalise_text(t) for t in texts if t.strip()]
+    if not texts:
+        return
+    try:
+        encode_cached(texts)
+    except Exception as e:
+        # Best effort - tools encode on demand anyway
+        print(f"Job embedding precompute failed: {e}")
 
 
 async def match_candidate_to_job(
@@ -60,18 +78,22 @@ async def match_candidate_to_job(
     Returns:
         FitAnalysis with complete scoring
     """
+    # Prefill cost is ~linear in input tokens - trim evidence and drop the raw ad text
+    # (already captured by the structured job fields)
     context = f"""
     Analyse this candidate-job match.
 
-    CANDIDATE: {resume}
+    CANDIDATE: {_context_json(resume)}
 
-    JOB: {job}
+    JOB: {_context_json(job, exclude={"description"})}
 
     INSTRUCTIONS:
     Evaluate entity wise fit using tools and reasoning to compute overall fit and generate Accept/Consider/Reject recommendation
 
     Return complete FitAnalysis.
     """
+    # Encode the job side while the model works on its first turn, before any tool call lands
+    prefetch = asyncio.create_task(asyncio.to_thread(precompute_job_embeddings, job))
     try:
         result = await matcher_agent.run(context)
         result=result.output
@@ -82,5 +104,8 @@ async def match_candidate_to_job(
         print("\n=== MATCHER FAILURE ===")
         print("Error:", e)
         raise
+    finally:
+        # Never leave the prefetch outliving this request on the session loop (it doesn't raise)
+        await prefetch
 
     return result
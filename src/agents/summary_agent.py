@@ -2,31 +2,82 @@
 Summary generation agent using Pydantic AI.
 Creates a fit summary for hiring manager.
 """
-from pathlib import Path
-from pydantic_ai import Agent
-from pydantic_ai.settings import ModelSettings
-
-from src.config import LLM_MODELS
+from src.agents.agent_factory import make_agent
 from src.models import FitAnalysis, ParsedResume, ParsedJob, SummaryGenerated
-from typing import Sequence
+from typing import AsyncIterator, Callable, Sequence, Tuple
 
-model = LLM_MODELS["summary"]
+# Create Pydantic AI agent with structured output for summary generation
+summary_agent = make_agent("summary")
 
-# Load prompt from version-controlled file
-PROMPT_PATH = Path(__file__).parent.parent / "prompts" / model.prompt_version / "summariser_prompt.txt"
-SUMMARY_PROMPT = PROMPT_PATH.read_text()
 
+def _resume_json(resume: ParsedResume) -> str:
+    """
+    Compact JSON rather than model repr - fewer input tokens.
+    The summary cites fit analysis evidence, so per-skill resume evidence maps are dropped.
+    """
+    return resume.model_dump_json(exclude_none=True, exclude={"skills_evidence", "qualifications_evidence"})
 
 
-# Create Pydantic AI agent with structured output for summary generation
-summary_agent = Agent(
-    model.name,
-    output_type=SummaryGenerated,
-    system_prompt=SUMMARY_PROMPT,
-    model_settings=ModelSettings(temperature=model.temperature, seed=42),
-    retries=3,
-    output_retries=3
-)
+def _build_context(
+    fit_analysis: FitAnalysis,
+    resume: ParsedResume,
+    job: ParsedJob,
+    recruiter_feedback: str = None,
+    message_history: Sequence = None
+) -> str:
+    """
+    Build the user prompt for a first summary or a recruiter-driven revision.
+    """
+    resume_json = _resume_json(resume)
+    job_json = job.model_dump_json(exclude_none=True)
+    fit_analysis_json = fit_analysis.model_dump_json(exclude_none=True)
+
+    if recruiter_feedback is None:
+        return f"""
+            Generate a hiring manager summary for this candidate-job match.
+
+            CANDIDATE RESUME (parsed): {resume_json}
+            
+            JOB: {job_json}
+
+            FIT ANALYSIS: {fit_analysis_json}
+
+            Write a clear, actionable summary for the hiring manager.
+            """
+
+    # Rerun with recruiter feedback
+    # Resume, job and fit analysis are already in the message history - send only the new turn
+    # so the shared prefix is reused by the provider's prompt cache
+    context = f"""
+            You are revising your hiring summary based on recruiter feedback.
+
+            IMPORTANT RULES:
+            - Fit analysis scores are informative and recruiter feedback is authoritative.
+            - Do NOT recompute or invent facts.
+            - Use recruiter feedback to refine interpretation and emphasis.
+            - If recommendation changes, explain why.
+
+            RECRUITER FEEDBACK:
+            {recruiter_feedback}
+
+            TASK:
+            Produce a revised hiring manager summary.
+            """
+
+    # No prior conversation - include the full analysis context
+    if not message_history:
+        context = f"""
+            CANDIDATE RESUME (parsed):
+            {resume_json}
+
+            JOB DESCRIPTION:
+            {job_json}
+
+            FIT ANALYSIS:
+            {fit_analysis_json}
+            """ + context
+
+    return context
 
 
 async def generate_summary(
@@ -51,50 +102,86 @@ async def generate_summary(
 
     """    
     try:
-        if recruiter_feedback is None:
-            # Prepare context
-            context = f"""
-            Generate a hiring manager summary for this candidate-job match.
+        context = _build_context(fit_analysis, resume, job, recruiter_feedback, message_history)
+        result = await summary_agent.run(context, message_history=message_history)
 
-            CANDIDATE RESUME (parsed): {resume}
-            
-            JOB: {job}
+        result_output = result.output
+        result_message_thread = result.all_messages()
+
+        # Ensure IDs
+        result_output.candidate_id = resume.candidate_id
+        result_output.job_id = job.job_id
 
-            FIT ANALYSIS: {fit_analysis}
+    except Exception as e:
+        print("\n=== SUMMARY FAILURE ===")
+        print("Error:", e)
+        raise
 
-            Write a clear, actionable summary for the hiring manager.
-            """
-            
-            result = await summary_agent.run(context)
+    return result_output, result_message_thread
+
+
+async def draft_summary(
+    resume: ParsedResume,
+    job: ParsedJob
+) -> Tuple[SummaryGenerated, list]:
+    """
+    Speculatively draft a summary from the parsed resume and job while fit analysis is still running.
+    
+    Args:
+        resume: Parsed resume
+        job: Parsed job description
         
-        # Rerun with recruiter feedback
-        else:
-            context = f"""
-            You are revising a hiring summary based on recruiter feedback.
+    Returns:
+        Draft SummaryGenerated object and message thread to finalise with refine_summary
+    """
+    context = f"""
+            Draft a hiring manager summary for this candidate-job match.
+            The fit analysis is not available yet. Do NOT state scores or a recommendation - they will be provided next.
 
-            IMPORTANT RULES:
-            - Fit analysis scores are informative and recruiter feedback is authoritative.
-            - Do NOT recompute or invent facts.
-            - Use recruiter feedback to refine interpretation and emphasis.
-            - If recommendation changes, explain why.
+            CANDIDATE RESUME (parsed): {_resume_json(resume)}
+            
+            JOB: {job.model_dump_json(exclude_none=True)}
+            """
+    try:
+        result = await summary_agent.run(context)
+    except Exception as e:
+        print("\n=== SUMMARY DRAFT FAILURE ===")
+        print("Error:", e)
+        raise
 
-            CANDIDATE RESUME (parsed):
-            {resume}
+    return result.output, result.all_messages()
 
-            JOB DESCRIPTION:
-            {job}
 
-            FIT ANALYSIS:
-            {fit_analysis}
+async def refine_summary(
+    fit_analysis: FitAnalysis,
+    resume: ParsedResume,
+    job: ParsedJob,
+    message_history: Sequence
+) -> Tuple[SummaryGenerated, list]:
+    """
+    Finalise a drafted summary once the fit analysis is available.
+    
+    Args:
+        fit_analysis: Computed fit analysis
+        resume: Parsed resume
+        job: Parsed job description
+        message_history: Message thread returned by draft_summary
+        
+    Returns:
+        SummaryGenerated object and message thread
+    """
+    context = f"""
+            Finalise your draft summary using the fit analysis below.
 
-            RECRUITER FEEDBACK:
-            {recruiter_feedback}
+            IMPORTANT RULES:
+            - Lead with the recommendation and overall score from the fit analysis.
+            - Fit analysis scores are authoritative. Do NOT recompute or invent facts.
+            - Correct any part of the draft the fit analysis does not support.
 
-            TASK:
-            Produce a revised hiring manager summary.
+            FIT ANALYSIS: {fit_analysis.model_dump_json(exclude_none=True)}
             """
-
-            result = await summary_agent.run(context, message_history=message_history)
+    try:
+        result = await summary_agent.run(context, message_history=message_history)
 
         result_output = result.output
         result_message_thread = result.all_messages()
@@ -109,3 +196,55 @@ async def generate_summary(
         raise
 
     return result_output, result_message_thread
+
+
+async def stream_summary(
+    fit_analysis: FitAnalysis,
+    resume: ParsedResume,
+    job: ParsedJob,
+    recruiter_feedback: str = None,
+    message_history: Sequence = None,
+    on_complete: Callable = None
+) -> AsyncIterator[str]:
+    """
+    Stream summary text as it is generated.
+
+    Args:
+        fit_analysis: Computed fit analysis
+        resume: Parsed resume
+        job: Parsed job description
+        recruiter_feedback: Recruiter's feedback/ comments
+        message_history: Agent's chat history to continue conversation
+        on_complete: Called with (SummaryGenerated, message thread) once the stream finishes
+
+    Yields:
+        New summary text since the previous chunk
+    """
+    try:
+        context = _build_context(fit_analysis, resume, job, recruiter_feedback, message_history)
+        async with summary_agent.run_stream(context, message_history=message_history) as result:
+            emitted = ""
+            # Partial outputs carry the summary generated so far - yield only the new text
+            async for partial in result.stream_output():
+                text = partial.summary or ""
+                if text.startswith(emitted) and len(text) > len(emitted):
+                    yield text[len(emitted):]
+                    emitted = text
+
+            result_output = await result.get_output()
+            if result_output.summary.startswith(emitted) and len(result_output.summary) > len(emitted):
+                yield result_output.summary[len(emitted):]
+
+            result_message_thread = result.all_messages()
+
+        # Ensure IDs
+        result_output.candidate_id = resume.candidate_id
+        result_output.job_id = job.job_id
+
+    except Exception as e:
+        print("\n=== SUMMARY FAILURE ===")
+        print("Error:", e)
+        raise
+
+    if on_complete is not None:
+        on_complete(result_output, result_message_thread)
@@ -3,7 +3,7 @@ Configuration file - make changes for each run
 """
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
 
 
 # -----------------------------
@@ -15,14 +15,48 @@ class ModelConfig:
     name: str
     temperature: float
     prompt_version: str = "v1"
+    max_tokens: Optional[int] = None
+    parallel_tool_calls: Optional[bool] = None
 
 @dataclass(frozen=True)
 class NLIModelConfig:
     name: str = "cross-encoder/nli-deberta-v3-base"
+    # Pairs are scored in batches of batch_size, truncated to max_length tokens
+    max_length: int = 256
+    batch_size: int = 32
+    # BF16 weights - halves memory traffic on AVX512-BF16 / AMX / GPU
+    bfloat16: bool = False
+    # torch.compile the classifier (dynamic shapes) - compiled during model warm-up
+    compile: bool = False
+
+@dataclass(frozen=True)
+class PIIModelConfig:
+    name: str = "lakshyakh93/deberta_finetuned_pii"
+    # Dynamic INT8 quantisation of Linear layers for faster CPU inference
+    # Off by default - NER recall decides what PII reaches the LLM; check entities before enabling
+    quantize_int8: bool = False
+    # BF16 weights + autocast instead (AVX512-BF16 / AMX / Apple M-series) - used when quantize_int8 is off
+    bfloat16: bool = False
+    # Graph-compile the model (IPEX when installed, else torch.compile) - first call pays the compile cost
+    compile: bool = False
+    # Run on ONNX Runtime via optimum (pip install .[onnx]) - replaces the torch options above
+    onnx: bool = False
+    # Skip NER for very short text or text that is already mostly redaction markers
+    min_ner_chars: int = 50
+    max_redaction_markers: int = 20
+    # Long resumes are split into overlapping token windows and run as one batch
+    window_tokens: int = 510
+    window_stride: int = 384
+    batch_size: int = 8
 
 @dataclass(frozen=True)
 class EmbedModelConfig:
     name: str = "Qwen/Qwen3-Embedding-0.6B"
+    # BF16 weights - halves memory traffic on AVX512-BF16 / AMX / GPU
+    bfloat16: bool = False
+    # Dynamic INT8 quantisation of Linear layers (takes precedence over bfloat16)
+    # Similarities shift slightly - recheck THRESHOLDS before enabling
+    quantize_int8: bool = False
 
 # -----------------------------
 # Thresholds & weights
@@ -47,6 +81,38 @@ class Weights:
     experience_kind: float = 0.6
 
 
+# -----------------------------
+# Runtime
+# -----------------------------
+
+@dataclass(frozen=True)
+class ContextBudget:
+    # Max characters kept per evidence snippet in the matcher prompt (full evidence stays in the report)
+    evidence_chars: int = 200
+
+@dataclass(frozen=True)
+class Features:
+    # Draft the summary while the matcher runs, then refine with fit analysis (costs extra tokens)
+    speculative_summary: bool = False
+
+@dataclass(frozen=True)
+class HTTPClientConfig:
+    # Connection limits apply per event loop (one pool per Streamlit session)
+    http2: bool = True
+    timeout: float = 60.0
+    max_connections: int = 64
+    max_keepalive_connections: int = 32
+
+@dataclass(frozen=True)
+class CacheConfig:
+    directory: str = ".cache/parsed"
+    parse_ttl_seconds: int = 7 * 24 * 60 * 60
+    # In-memory LRU of sentence embeddings (by normalised text)
+    embedding_entries: int = 4096
+    # In-memory LRU of detect_pii results (by text digest)
+    pii_entries: int = 32
+
+
 # -----------------------------
 # Central registry
 # -----------------------------
@@ -65,7 +131,9 @@ LLM_MODELS: Dict[str, ModelConfig] = {
     "matcher": ModelConfig(
         name="openai:gpt-5-2025-08-07",
         temperature=0.5,
-        prompt_version="v1"
+        prompt_version="v1",
+        max_tokens=16384,
+        parallel_tool_calls=True
     ),
     "summary": ModelConfig(
         name="openai:gpt-5-2025-08-07",
@@ -76,5 +144,10 @@ LLM_MODELS: Dict[str, ModelConfig] = {
 
 THRESHOLDS = Thresholds()
 WEIGHTS = Weights()
+FEATURES = Features()
+CONTEXT_BUDGET = ContextBudget()
+HTTP_CLIENT = HTTPClientConfig()
+CACHE = CacheConfig()
 NLIModel= NLIModelConfig()
+PIIModel = PIIModelConfig()
 EMBEDModel = EmbedModelConfig()
@@ -2,7 +2,8 @@
 Pydantic data models for the candidate-job matching system.
 Provides type-safe schemas for all data structures.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
 from typing import Optional, List, Dict, Literal
 from datetime import datetime
 
@@ -48,7 +49,9 @@ class RedacteddResume(BaseModel):
 # Evidence
 # ============================================================================
 
-class EntityEvidence(BaseModel):
+# Slotted and immutable - one instance per extracted skill, qualification, responsibility...
+@dataclass(frozen=True, slots=True)
+class EntityEvidence:
     """
     Single supporting evidence snippet for an extracted entity.
     """
@@ -139,6 +142,15 @@ class ParsedJob(BaseModel):
     description: str = Field(description="Full job description")
 
 
+# ============================================================================
+# VALIDATORS
+# ============================================================================
+
+# Module-level adapters - compiled once, reused for every JSON rehydration
+PARSED_RESUME_ADAPTER = TypeAdapter(ParsedResume)
+PARSED_JOB_ADAPTER = TypeAdapter(ParsedJob)
+
+
 # ============================================================================
 # MATCHING AND SCORING MODELS
 # ============================================================================
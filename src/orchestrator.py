@@ -4,23 +4,45 @@ Orchestrator coordinates the complete analysis pipeline.
 Pipeline:
 1. Load documents → text
 2. Redact PII (resume only)
-3. Parse resume 
+3. Parse resume (concurrently with 4)
 4. Parse job
 5. Match ad and resume → FitAnalysis
 6. Generate summary
 7. Return AnalysisReport
 8. Regenerate summary with recruiter comments
 """
+import asyncio
 from datetime import datetime
+from src.config import FEATURES
 from src.models import AnalysisReport, RedacteddResume, CandidateDetail, SummaryGenerated
 from src.pii_redactor import PIIDetector
 from src.utils.data_loader import load_document
 from src.agents.resume_agent import parse_resume
 from src.agents.job_agent import parse_job
 from src.agents.matcher_agent import match_candidate_to_job
-from src.agents.summary_agent import generate_summary
+from src.agents.summary_agent import generate_summary, stream_summary, draft_summary, refine_summary
+from typing import AsyncIterator
 import json
 
+async def _run_together(*coros) -> list:
+    """
+    Run coroutines concurrently; on the first failure cancel the rest and re-raise that error.
+    (Unlike asyncio.gather, no sibling is left pending on the session's long-lived loop.)
+    
+    Args:
+        coros: Coroutines to run
+        
+    Returns:
+        Results in argument order
+    """
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(coro) for coro in coros]
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0]
+    return [task.result() for task in tasks]
+
+
 class MatchingOrchestrator:
     """
     Orchestrates the complete candidate-job matching pipeline.
@@ -63,29 +85,39 @@ class MatchingOrchestrator:
         print(f"Starting analysis: {candidate_id} → {job_id}")
         
         # ----------------------------------------------------------
-        # Step 1: Load documents
+        # Step 1: Load documents (concurrently, off the event loop)
         # ----------------------------------------------------------
-        try:
-            resume_text = load_document(resume_source)
-            progress_callback(f"**Status:** Resume loaded ... **Now:** Loading job ad")
+        async def _load_resume():
+            try:
+                text = await asyncio.to_thread(load_document, resume_source)
+                progress_callback(f"**Status:** Resume loaded")
+                return text
 
-        except Exception as e:
-            progress_callback(f"**Status:** Resume load failed")
-            raise ValueError(f"Failed to load resume from {resume_source}: {e}")
-        
-        try:
-            job_text = load_document(job_source)
-            progress_callback(f"**Status:** Job loaded ... **Now:** Redacting resume")
+            except Exception as e:
+                progress_callback(f"**Status:** Resume load failed")
+                raise ValueError(f"Failed to load resume from {resume_source}: {e}")
 
-        except Exception as e:
-            progress_callback(f"**Status:** Job load failed")
-            raise ValueError(f"Failed to load job from {job_source}: {e}")
+        async def _load_job():
+            try:
+                text = await asyncio.to_thread(load_document, job_source)
+                progress_callback(f"**Status:** Job loaded")
+                return text
+
+            except Exception as e:
+                progress_callback(f"**Status:** Job load failed")
+                raise ValueError(f"Failed to load job from {job_source}: {e}")
+
+        resume_text, job_text = await _run_together(_load_resume(), _load_job())
+        progress_callback(f"**Status:** Resume and job loaded ... **Now:** Redacting resume")
 
         # ----------------------------------------------------------
         # Step 2: Redact PII from resume
         # ----------------------------------------------------------
         try:
-            processed_resume, candidate_details = self.pii_detector.process_resume(resume_text, candidate_id)
+            # NER inference is CPU-bound - keep the event loop free for other sessions
+            processed_resume, candidate_details = await asyncio.to_thread(
+                self.pii_detector.process_resume, resume_text, candidate_id
+            )
             pii_count = len(processed_resume.pii_entities)
             print(f"Removed {pii_count} PII entities")
             print(f"Removed {processed_resume.pii_entities}")
@@ -110,43 +142,64 @@ class MatchingOrchestrator:
             candidate_details=CandidateDetail
 
         # ----------------------------------------------------------
-        # Step 3: Parse resume
+        # Step 3 & 4: Parse resume and job concurrently
         # ----------------------------------------------------------
-        try:
-            parsed_resume = await parse_resume(processed_resume.redacted_text, candidate_id)
-            progress_callback("**Status:** Resume parsed ... **Now:** Parsing job ad")
+        async def _parse_resume():
+            try:
+                result = await parse_resume(processed_resume.redacted_text, candidate_id)
+                progress_callback("**Status:** Resume parsed")
+                return result
 
-        except Exception as e:
-            progress_callback("**Status:** Resume parse failed")
-            raise Exception(f"Resume parsing failed: {e}")
-        
-        # ----------------------------------------------------------
-        # Step 4: Parse job
-        # ----------------------------------------------------------
-        try:
-            parsed_job = await parse_job(job_text, job_id)
-            progress_callback("**Status:** Job ad parsed ... **Now:** Computing fit")
+            except Exception as e:
+                progress_callback("**Status:** Resume parse failed")
+                raise Exception(f"Resume parsing failed: {e}")
 
-        except Exception as e:
-            progress_callback("**Status:** Job ad parsing failed")
-            raise Exception(f"Job parsing failed: {e}")
+        async def _parse_job():
+            try:
+                result = await parse_job(job_text, job_id)
+                progress_callback("**Status:** Job ad parsed")
+                return result
+
+            except Exception as e:
+                progress_callback("**Status:** Job ad parsing failed")
+                raise Exception(f"Job parsing failed: {e}")
+
+        parsed_resume, parsed_job = await _run_together(_parse_resume(), _parse_job())
+        progress_callback("**Status:** Resume and job ad parsed ... **Now:** Computing fit")
 
         # ----------------------------------------------------------
-        # Step 5: Analyse fit
+        # Step 5: Analyse fit (optionally drafting the summary meanwhile)
         # ----------------------------------------------------------
+        draft_task = None
+        if FEATURES.speculative_summary:
+            draft_task = asyncio.create_task(draft_summary(parsed_resume, parsed_job))
+
         try:
             fit_analysis = await match_candidate_to_job(parsed_resume, parsed_job)
             progress_callback("**Status:** Candidate fit analysed ... **Now:** Generating summary")
 
         except Exception as e:
+            if draft_task is not None:
+                draft_task.cancel()
             progress_callback("**Status:** Candidate fit analysis failed")
             raise Exception(f"Matching failed: {e}")
         
         # ----------------------------------------------------------
         # Step 6: Generate summary
         # ----------------------------------------------------------
+        draft_thread = None
+        if draft_task is not None:
+            try:
+                _, draft_thread = await draft_task
+            except Exception as e:
+                # Fall back to a full summary run
+                print(f"Summary draft failed: {e}")
+
         try:
-            summary, message_thread = await generate_summary(fit_analysis, parsed_resume, parsed_job)
+            if draft_thread is not None:
+                summary, message_thread = await refine_summary(fit_analysis, parsed_resume, parsed_job, draft_thread)
+            else:
+                summary, message_thread = await generate_summary(fit_analysis, parsed_resume, parsed_job)
             self.message_thread = message_thread
 
         except Exception as e:
@@ -201,3 +254,39 @@ class MatchingOrchestrator:
 
         except Exception as e:
             raise Exception(f"Summary generation failed: {e}")
+
+
+    async def stream_regenerated_summary(
+        self,
+        report: AnalysisReport,
+        recruiter_feedback: str
+    )->AsyncIterator[str]:
+        """
+        Regenerate summary using recruiter feedback, streaming text as it is generated.
+        report.summary is updated once the stream completes.
+        
+        Args:
+            report: AnalysisReport from previous run
+            recruiter_feedback: Recruiter's comments
+            
+        Yields:
+            Summary text chunks
+        """
+        def _on_complete(summary: SummaryGenerated, message_thread):
+            report.summary = summary
+            self.message_thread = message_thread
+            print(f"Summary regenerated!")
+
+        try:
+            async for chunk in stream_summary(
+                fit_analysis=report.fit_analysis,
+                resume=report.resume,
+                job=report.job,
+                recruiter_feedback=recruiter_feedback,
+                message_history=self.message_thread,
+                on_complete=_on_complete
+            ):
+                yield chunk
+
+        except Exception as e:
+            raise Exception(f"Summary generation failed: {e}")
@@ -2,12 +2,144 @@
 Simple PII Detection using GLiNER.
 Detects: NAME, EMAIL, PHONE, URL, LOCATION
 """
+import hashlib
 import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Tuple
 from datetime import datetime
 import torch
 from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline as hf_pipeline
 from src.models import PIIEntity, CandidateDetail, RedacteddResume
+from src.config import PIIModel, CACHE
+
+# Regex patterns for structured PII
+_EMAIL_RE = r"""
+    \b                              # Word boundary
+    [A-Za-z0-9._%+-]+               # Local part (username)
+    @                               # @ symbol
+    [A-Za-z0-9.-]+                  # Domain name
+    \.                              # Dot before TLD
+    [A-Za-z]{2,}                   # Top-level domain (2+ letters)
+    \b                              # Word boundary
+"""
+
+_PHONE_RE = r"""
+    \b                              # Word boundary
+    (?:\+?\d{1,3}[\s-]?)?           # Optional country code (+1, +61, +44)
+    (?:                             # Optional area code
+        \(?\d{2,4}\)?               # Area code with optional parentheses
+        [\s-]?                      # Optional separator
+    )?
+    \d{3,4}                         # First local number block
+    [\s-]?                          # Optional separator
+    \d{3,4}                         # Second local number block
+    \b                              # Word boundary
+"""
+
+_URL_RE = r"""
+    (?<!@)                               # Not part of an email
+    \b
+    (
+        (?:https?://|www\.)              # Scheme OR www
+        [a-z0-9-]+(\.[a-z0-9-]+)+         # Domain
+        (?:/[^\s<>"']*)?                 # Optional path
+        |
+        [a-z0-9-]+(\.[a-z0-9-]+)+         # Bare domain
+        /[^\s<>"']+                      # BUT must have a path
+    )
+    \b
+"""
+
+# One scan for all structured PII - alternatives tried in order at each position,
+# so an email's domain or digits inside a URL are not reported twice
+PII_PATTERN = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in (
+        ("EMAIL", _EMAIL_RE),
+        ("PHONE", _PHONE_RE),
+        ("URL", _URL_RE),
+    )),
+    re.IGNORECASE | re.VERBOSE
+)
+
+# Placeholders written by process_resume - text full of these has already been redacted
+REDACTION_MARKER = re.compile(r"\[(?:NAME|EMAIL|PHONE|URL|LOCATION)\]")
+
+# detect_pii results by text digest - regenerate flows re-run the same resume
+_detection_cache: "OrderedDict[bytes, List[PIIEntity]]" = OrderedDict()
+_detection_lock = threading.Lock()
+
+
+def _ner_dtype() -> torch.dtype:
+    """Weights dtype - INT8 quantisation needs FP32 weights to start from."""
+    if PIIModel.bfloat16 and not PIIModel.quantize_int8:
+        return torch.bfloat16
+    return torch.float32
+
+
+def _compile_model(model):
+    """
+    Fuse kernels and cut Python dispatch overhead - IPEX when installed, else torch.compile.
+    """
+    try:
+        import intel_extension_for_pytorch as ipex
+        return ipex.optimize(model.eval(), dtype=_ner_dtype(), inplace=True)
+    except ImportError:
+        pass
+
+    # Compile forward in place so the pipeline still sees a PreTrainedModel;
+    # window lengths vary, so compile for dynamic shapes
+    model.forward = torch.compile(model.forward, dynamic=True)
+    return model
+
+
+def _load_onnx_model(model_name: str):
+    """
+    Export the token classifier to ONNX and load it on ONNX Runtime (fused CPU kernels).
+    Returns None when optimum/onnxruntime isn't installed.
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForTokenClassification
+    except ImportError:
+        print("optimum[onnxruntime] not installed - falling back to PyTorch for PII NER")
+        return None
+    return ORTModelForTokenClassification.from_pretrained(
+        model_name, export=True, provider="CPUExecutionProvider"
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_ner_pipeline(model_name: str):
+    """
+    Load tokenizer + token classifier and build the NER pipeline once per process.
+    """
+    device="cpu"
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+    if PIIModel.onnx:
+        model = _load_onnx_model(model_name)
+        if model is not None:
+            return hf_pipeline("ner", model=model, tokenizer=tokenizer, aggregation_strategy="simple")
+
+    model = AutoModelForTokenClassification.from_pretrained(model_name, dtype=_ner_dtype())
+    model.to(device)
+
+    if PIIModel.quantize_int8:
+        # INT8 weights for nn.Linear - matmuls run on fbgemm (x86) / qnnpack (ARM) int8 kernels
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    if PIIModel.compile:
+        model = _compile_model(model)
+
+    return hf_pipeline(
+        "ner",
+        model=model,
+        tokenizer=tokenizer,
+        aggregation_strategy="simple",
+        device=device
+    )
 
 
 class PIIDetector:
@@ -17,70 +149,12 @@ class PIIDetector:
     Just loads model and detects PII - nothing fancy.
     """
     
-    MODEL_NAME = "lakshyakh93/deberta_finetuned_pii"
+    MODEL_NAME = PIIModel.name
     
     def __init__(self):
         """Load the model."""
-        device="cpu"
-        tokenizer = AutoTokenizer.from_pretrained(self.MODEL_NAME)
-        model = AutoModelForTokenClassification.from_pretrained(self.MODEL_NAME, dtype=torch.float32)
-        model.to(device)
-
-        self.ner = hf_pipeline(
-            "ner",
-            model=model,
-            tokenizer=tokenizer,
-            aggregation_strategy="simple",
-            device=device
-        )
-        
-        # Regex patterns for structured PII
-        self.email_pattern = re.compile(
-            r"""
-            \b                              # Word boundary
-            [A-Za-z0-9._%+-]+               # Local part (username)
-            @                               # @ symbol
-            [A-Za-z0-9.-]+                  # Domain name
-            \.                              # Dot before TLD
-            [A-Za-z]{2,}                   # Top-level domain (2+ letters)
-            \b                              # Word boundary
-            """,
-            re.VERBOSE
-        )
-
-        self.phone_pattern = re.compile(
-            r"""
-            \b                              # Word boundary
-            (?:\+?\d{1,3}[\s-]?)?           # Optional country code (+1, +61, +44)
-            (?:                             # Optional area code
-                \(?\d{2,4}\)?               # Area code with optional parentheses
-                [\s-]?                      # Optional separator
-            )?
-            \d{3,4}                         # First local number block
-            [\s-]?                          # Optional separator
-            \d{3,4}                         # Second local number block
-            \b                              # Word boundary
-            """,
-            re.VERBOSE
-        )
-
-        self.url_pattern = re.compile(
-            r"""
-            (?<!@)                               # Not part of an email
-            \b
-            (
-                (?:https?://|www\.)              # Scheme OR www
-                [a-z0-9-]+(\.[a-z0-9-]+)+         # Domain
-                (?:/[^\s<>"']*)?                 # Optional path
-                |
-                [a-z0-9-]+(\.[a-z0-9-]+)+         # Bare domain
-                /[^\s<>"']+                      # BUT must have a path
-            )
-            \b
-            """,
-            re.IGNORECASE | re.VERBOSE
-        )
-
+        # Shared across detector instances - one warm pipeline per process
+        self.ner = _get_ner_pipeline(self.MODEL_NAME)
         
     def _normalise_label(self, label: str) -> str:
         """Map model labels to our types."""
@@ -105,49 +179,90 @@ class PIIDetector:
         """
         entities = []
 
-        patterns = [
-            ("EMAIL", self.email_pattern),
-            ("PHONE", self.phone_pattern),
-            ("URL", self.url_pattern),
-        ]
-
-        for entity_type, pattern in patterns:
-            for match in pattern.finditer(text):
-                entities.append(PIIEntity(
-                    entity_type=entity_type,
-                    text=match.group(),
-                    start_char=match.start(),
-                    end_char=match.end(),
-                    confidence=1.0,  # deterministic
-                    replacement=f"[{entity_type}]"
-                ))
+        # Fields are machine-generated and well-typed - skip validation
+        for match in PII_PATTERN.finditer(text):
+            entity_type = match.lastgroup
+            entities.append(PIIEntity.model_construct(
+                entity_type=entity_type,
+                text=match.group(),
+                start_char=match.start(),
+                end_char=match.end(),
+                confidence=1.0,  # deterministic
+                replacement=f"[{entity_type}]"
+            ))
 
         return entities
     
-    def detect_pii(self, text: str) -> List[PIIEntity]:
+    def _ner_windows(self, text: str) -> List[Tuple[int, int]]:
         """
-        Detect PII entities in text.
+        Split text into overlapping (start_char, end_char) windows of at most window_tokens tokens.
+        """
+        offsets = self.ner.tokenizer(
+            text, return_offsets_mapping=True, add_special_tokens=False, truncation=False
+        )["offset_mapping"]
+        if not offsets:
+            return []
+
+        windows = []
+        for start_tok in range(0, len(offsets), PIIModel.window_stride):
+            end_tok = min(start_tok + PIIModel.window_tokens, len(offsets))
+            windows.append((offsets[start_tok][0], offsets[end_tok - 1][1]))
+            if end_tok == len(offsets):
+                break
+        return windows
+
+    def _run_ner(self, text: str) -> List[dict]:
+        """
+        Run NER over overlapping windows in one batched call, with offsets rebased onto text.
+        Avoids truncation and full-length self-attention on long resumes.
+        """
+        windows = self._ner_windows(text)
+        if not windows:
+            return []
+
+        with torch.inference_mode(), torch.autocast(device_type="cpu", dtype=torch.bfloat16, enabled=_ner_dtype() == torch.bfloat16):
+            batch_results = self.ner([text[s:e] for s, e in windows], batch_size=PIIModel.batch_size)
+
+        entities = []
+        for (window_start, _), window_entities in zip(windows, batch_results):
+            for ent in window_entities:
+                ent["start"] += window_start
+                ent["end"] += window_start
+                entities.append(ent)
+
+        # Drop duplicates from window overlaps - keep the longest span at each start
+        deduped = []
+        for ent in sorted(entities, key=lambda e: (e["start"], -e["end"])):
+            if deduped and ent["start"] < deduped[-1]["end"]:
+                continue
+            deduped.append(ent)
+        return deduped
+
+    def _merge_ner_entities(self, entities: List[dict], occupied_spans: List[Tuple[int, int]]) -> List[PIIEntity]:
+        """
+        Merge contiguous NER tokens of the same type into entities, skipping occupied spans.
         
         Args:
-            text: Input text
+            entities: Deduplicated NER output sorted by start offset (later tokens never
+                overlap earlier merged entities, so only occupied_spans need checking)
+            occupied_spans: (start_char, end_char) spans already claimed (e.g. by regex)
             
         Returns:
-            List of PIIEntity objects
-        """        
-        pii_entities = []
-        
-        # Regex-based detection (EMAIL, PHONE, URL)
-        regex_entities = self._detect_with_regex(text)
-        pii_entities.extend(regex_entities)
-
-        # Track occupied spans
-        occupied_spans = [
-            (ent.start_char, ent.end_char) for ent in regex_entities
-        ]
+            List of merged PIIEntity objects
+        """
+        # Coalesce occupied spans into sorted, disjoint intervals so an overlap check
+        # only needs the neighbours found by bisect
+        occ_starts, occ_ends = [], []
+        for s, e in sorted(occupied_spans):
+            if occ_ends and s < occ_ends[-1]:
+                occ_ends[-1] = max(occ_ends[-1], e)
+            else:
+                occ_starts.append(s)
+                occ_ends.append(e)
 
-        # NER-based detection (NAME, LOCATION)
-        entities = self.ner(text)
-        current_entity = None  # buffer for merging spans
+        merged = []  # (entity_type, text pieces, start_char, end_char, confidence)
+        current = None
+        current_group = None
 
         for ent in entities:
             normalised = self._normalise_label(ent["entity_group"])
@@ -156,53 +271,81 @@ class PIIDetector:
             start, end = ent["start"], ent["end"]
 
             # Skip if overlaps with regex-detected span
-            if any(not (end <= s or start >= e) for s, e in occupied_spans):
+            idx = bisect_right(occ_starts, start) - 1
+            if (idx >= 0 and occ_ends[idx] > start) or (idx + 1 < len(occ_starts) and occ_starts[idx + 1] < end):
                 continue
 
             # If starting a new entity OR entity type changes OR span is non-contiguous (with space)
-            if (
-                current_entity is None
-                or current_entity["entity_type"] != normalised
-                or start > current_entity["end_char"] + 1
-            ):
+            if current is None or current[0] != normalised or start > current[3] + 1:
                 # Flush previous entity - if entity changes
-                if current_entity is not None:
-                    pii_entities.append(PIIEntity(**current_entity))
-                    occupied_spans.append((current_entity["start_char"], current_entity["end_char"]))
-
-                # Start new entity
-                current_entity = {
-                    "entity_type": normalised,
-                    "entity_group": ent["entity_group"],
-                    "text": ent["word"],
-                    "start_char": start,
-                    "end_char": end,
-                    "confidence": float(ent["score"]),
-                    "replacement": f"[{normalised}]",
-                }
+                if current is not None:
+                    merged.append(current)
+                current = [normalised, [ent["word"]], start, end, float(ent["score"])]
 
             else:
-                # Merge with current entity
-
                 # If same sub type ex. First name - First name, append as is, else First name - Last name, add space
-                if ent["entity_group"] == current_entity["entity_group"]:
-                    text = ent["word"]
+                if ent["entity_group"] == current_group:
+                    current[1].append(ent["word"])
                 else:
-                    text = " " + ent["word"]
-                current_entity["text"] += text
-                current_entity["entity_group"] = ent["entity_group"]
-                current_entity["end_char"] = end
-                current_entity["confidence"] = max(
-                    current_entity["confidence"],
-                    float(ent["score"])
-                )
+                    current[1].append(" " + ent["word"])
+                current[3] = end
+                current[4] = max(current[4], float(ent["score"]))
+            current_group = ent["entity_group"]
 
         # Flush final entity
-        if current_entity is not None:
-            pii_entities.append(PIIEntity(**current_entity))
-            occupied_spans.append((current_entity["start_char"], current_entity["end_char"]))
+        if current is not None:
+            merged.append(current)
+
+        # Build once per merged entity rather than per token; fields are well-typed - skip validation
+        return [
+            PIIEntity.model_construct(
+                entity_type=entity_type,
+                text="".join(pieces),
+                start_char=start,
+                end_char=end,
+                confidence=confidence,
+                replacement=f"[{entity_type}]"
+            )
+            for entity_type, pieces, start, end, confidence in merged
+        ]
 
-        return pii_entities
+    def detect_pii(self, text: str) -> List[PIIEntity]:
+        """
+        Detect PII entities in text.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            List of PIIEntity objects
+        """        
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        with _detection_lock:
+            if key in _detection_cache:
+                _detection_cache.move_to_end(key)
+                return list(_detection_cache[key])
+
+        pii_entities = []
+        
+        # Regex-based detection (EMAIL, PHONE, URL)
+        regex_entities = self._detect_with_regex(text)
+        pii_entities.extend(regex_entities)
+
+        # Track occupied spans
+        occupied_spans = [
+            (ent.start_char, ent.end_char) for ent in regex_entities
+        ]
+
+        # NER-based detection (NAME, LOCATION) - not worth a model pass on tiny or already redacted text
+        if len(text) >= PIIModel.min_ner_chars and len(REDACTION_MARKER.findall(text)) <= PIIModel.max_redaction_markers:
+            pii_entities.extend(self._merge_ner_entities(self._run_ner(text), occupied_spans))
+
+        with _detection_lock:
+            _detection_cache[key] = pii_entities
+            while len(_detection_cache) > CACHE.pii_entries:
+                _detection_cache.popitem(last=False)
+
+        return list(pii_entities)
     
     def process_resume(self, text: str, candidate_id: str = "") -> Tuple[RedacteddResume, CandidateDetail]:
         """
@@ -220,14 +363,18 @@ class PIIDetector:
         pii_entities = self.detect_pii(text)
         
         # Redact resume
-        # Replace PII from end to start to preserve positions while replacing
-        redacted_text = text
-        for entity in sorted(pii_entities, key=lambda e: e.start_char, reverse=True):
-            redacted_text = (
-                redacted_text[:entity.start_char] +
-                entity.replacement +
-                redacted_text[entity.end_char:]
-            )
+        # Single left-to-right walk: collect kept slices and replacements, join once
+        # Longest span first at each start; spans starting inside a redacted one are dropped
+        parts = []
+        cursor = 0
+        for entity in sorted(pii_entities, key=lambda e: (e.start_char, -e.end_char)):
+            if entity.start_char < cursor:
+                continue
+            parts.append(text[cursor:entity.start_char])
+            parts.append(entity.replacement)
+            cursor = entity.end_char
+        parts.append(text[cursor:])
+        redacted_text = "".join(parts)
 
         resume_id = candidate_id or f"cand_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
@@ -1,15 +1,17 @@
 """
 Tool definition for education fit evaluation
 """
-import re
+import asyncio
+from functools import lru_cache
 import numpy as np
 from typing import List, Dict, Optional
-from src.utils.embedding_model import embed_model
+from src.utils.embedding_cache import encode_cached, normalise_text
 from src.config import THRESHOLDS
 
-def _norm(s: str) -> str:
-    """Normalisation - Basic lower case and white space normalisation"""
-    return re.sub(r"\s+", " ", s.lower().strip())
+@lru_cache(maxsize=4096)
+def _strip_punct(s: str) -> str:
+    """Drop abbreviation dots and apostrophes only - "b.sc"/"bsc", "master's"/"masters" compare equal; "c++" and "c#" stay distinct"""
+    return s.replace(".", "").replace("'", "")
 
 async def score_education_and_qualification(
     ad_required_qualification: Optional[str],
@@ -40,25 +42,40 @@ async def score_education_and_qualification(
     if not candidate_qualification:
         return {f"{education_or_qualification}_required": ad_required_qualification, "best_candidate_match": None, "score": 50.0, "note": f"Candidate {education_or_qualification} not specified."}
 
-    ad_norm = _norm(ad_required_qualification)
-    cand_norm = [_norm(e) for e in candidate_qualification]
-    
-    # Lexical
-    if ad_norm in cand_norm:
-        return {
-            f"{education_or_qualification}_required": ad_required_qualification,
-            "best_candidate_match": ad_required_qualification,
-            "score": 100,
-            "note": f"Job does not specify {education_or_qualification} requirement.",
-        }
+    ad_norm = normalise_text(ad_required_qualification)
+
+    # Lexical - normalise lazily and stop at the first exact match
+    cand_norm = []
+    for e in candidate_qualification:
+        cand_norm.append(normalise_text(e))
+        if cand_norm[-1] == ad_norm:
+            return {
+                f"{education_or_qualification}_required": ad_required_qualification,
+                "best_candidate_match": ad_required_qualification,
+                "score": 100,
+                "note": f"Job does not specify {education_or_qualification} requirement.",
+            }
+
+    # Same text apart from dots/apostrophes (e.g. "B.Sc" vs "BSc") - skip the embedding pass
+    ad_plain = _strip_punct(ad_norm)
+    for idx, c in enumerate(cand_norm):
+        if _strip_punct(c) == ad_plain:
+            return {
+                f"{education_or_qualification}_required": ad_required_qualification,
+                "best_candidate_match": candidate_qualification[idx],
+                "score": 100,
+                "note": "Candidate meets requirement.",
+            }
 
-    # Semantic
-    ad_education_embed = embed_model.encode(ad_norm, normalize_embeddings=True)
-    candidate_education_embed = embed_model.encode(cand_norm, normalize_embeddings=True)
+    # Semantic - ad and candidate encoded in one batched forward pass
+    # Cached by normalised text - the same candidate entries are scored against every ad requirement
+    # Off the event loop - concurrent tool calls from the matcher aren't serialised behind the encode
+    embeds = await asyncio.to_thread(encode_cached, [ad_norm, *cand_norm])
 
-    sims = embed_model.similarity(ad_education_embed, candidate_education_embed)
+    # Normalised embeddings - cosine similarity is a dot product
+    sims = embeds[1:] @ embeds[0]
     max_sim_idx = int(np.argmax(sims))
-    max_sim_val = float(sims[0][max_sim_idx].numpy())
+    max_sim_val = float(sims[max_sim_idx])
 
     # Semantic match
     if max_sim_val>=THRESHOLDS.semantic_match:
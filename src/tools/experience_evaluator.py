@@ -1,16 +1,37 @@
 """
 Tool definition for experience (years and kind) fit evaluation
 """
-from src.utils.embedding_model import embed_model
+from src.utils.embedding_cache import encode_cached, normalise_text
 import numpy as np
 from typing import List, Optional
-import re
 from src.config import WEIGHTS, THRESHOLDS
 
 
-def _norm(s: str) -> str:
-    """Normalisation - Basic lower case and white space normalisation"""
-    return re.sub(r"\s+", " ", s.lower().strip())
+# combine_experience_scores weights, packed once at import
+_EXPERIENCE_W = np.array([WEIGHTS.experience_years, WEIGHTS.experience_kind], dtype=np.float64)
+
+
+def score_experience_years_batch(candidate_years: np.ndarray, required_years: np.ndarray) -> np.ndarray:
+    """
+    Vectorised experience years scoring over many (candidate, job) pairs - NaN marks an unspecified value.
+
+    Args:
+        candidate_years: Candidate years of experience per pair
+        required_years: Required years of experience per pair
+
+    Returns:
+        np.ndarray of scores (0–100+), one per pair
+    """
+    candidate_years = np.asarray(candidate_years, dtype=np.float64)
+    required_years = np.asarray(required_years, dtype=np.float64)
+    # NaN > 0 is False - unspecified and non-positive requirements share the neutral score
+    valid_req = required_years > 0
+    ratio = candidate_years / np.where(valid_req, required_years, 1.0)
+    return np.where(
+        np.isnan(required_years), 70.0,
+        np.where(np.isnan(candidate_years), 50.0, np.where(valid_req, ratio * 100.0, 70.0))
+    )
+
 
 def score_experience_years(candidate_years: Optional[float], required_years: Optional[float]) -> dict:
     """
@@ -28,17 +49,74 @@ def score_experience_years(candidate_years: Optional[float], required_years: Opt
             "note": str
         }
     """
+    score = float(score_experience_years_batch(
+        np.nan if candidate_years is None else candidate_years,
+        np.nan if required_years is None else required_years
+    ))
+
     if required_years is None:
-        return {"candidate_years": candidate_years, "required_years": required_years, "score": 70.0, "note": "Job years requirement not specified."}
-    if candidate_years is None:
-        return {"candidate_years": candidate_years, "required_years": required_years, "score": 50.0, "note": "Candidate years not specified."}
-    if required_years <= 0:
-        return {"candidate_years": candidate_years, "required_years": required_years, "score": 70.0, "note": "Non-positive required years treated as unspecified."}
+        note = "Job years requirement not specified."
+    elif candidate_years is None:
+        note = "Candidate years not specified."
+    elif required_years <= 0:
+        note = "Non-positive required years treated as unspecified."
+    else:
+        note = f"Candidate/required ratio={candidate_years / required_years:.2f}."
 
-    ratio = candidate_years / required_years
-    score=ratio*100
+    return {"candidate_years": candidate_years, "required_years": required_years, "score": score, "note": note}
 
-    return {"candidate_years": candidate_years, "required_years": required_years, "score": score, "note": f"Candidate/required ratio={ratio:.2f}."}
+
+def score_experience_kinds_batch(required_kinds: List[str], candidate_experience_texts: List[str]) -> List[dict]:
+    """
+    Evaluate ALL types or domains of experience required by the job against
+    the candidate's past experience in one call, using lexical and semantic similarity.
+
+    Args:
+        required_kinds: Descriptions of every experience type required by the job
+        candidate_experience_texts: List of candidate experience descriptions
+
+    Returns:
+        One entry per required kind, in order:
+        [{
+            "ad_required_kind": str | None,
+            "candidate_matching_text": str | None,
+            "score": int (0–100) experience kind match score,
+            "similarity": float (0.0–1.0) semantic similarity score
+        }]
+    """
+    results: List[Optional[dict]] = [None] * len(required_kinds)
+    pending = []
+    # Exact-text lookup - O(1) per required kind
+    cand_set = set(candidate_experience_texts)
+
+    for i, required_kind in enumerate(required_kinds):
+        if not required_kind or not required_kind.strip():
+            results[i] = {"ad_required_kind": None, "candidate_matching_text": candidate_experience_texts[0] if candidate_experience_texts else None, "score": 70.0, "similarity": 0.0}
+        elif not candidate_experience_texts:
+            results[i] = {"ad_required_kind": required_kind, "candidate_matching_text": None, "score": 30.0, "similarity": 0.0}
+        elif required_kind in cand_set:
+            results[i] = {"ad_required_kind": required_kind, "candidate_matching_text": required_kind, "score": 100.0, "similarity": 1.0}
+        else:
+            pending.append(i)
+
+    if pending:
+        # All required kinds and all candidate texts as two matrices - one (kinds x texts) matmul
+        # Cached by normalised text - the same experience entries are scored for every required kind
+        req_embed = encode_cached([normalise_text(required_kinds[i]) for i in pending])
+        cands_embed = encode_cached([normalise_text(t) for t in candidate_experience_texts])
+
+        # Normalised embeddings - cosine similarity is a dot product
+        sims = req_embed @ cands_embed.T
+        best_idx = sims.argmax(axis=1)
+        best_val = sims[np.arange(len(pending)), best_idx]
+
+        # map similarity to score
+        scores = np.where(best_val >= THRESHOLDS.experience_match_score, 100.0, best_val * 100)
+
+        for i, max_sim_idx, max_sim_val, score in zip(pending, best_idx.tolist(), best_val.tolist(), scores.tolist()):
+            results[i] = {"ad_required_kind": required_kinds[i], "candidate_matching_text": candidate_experience_texts[max_sim_idx], "score": score, "similarity": max_sim_val}
+
+    return results
 
 
 def score_experience_kind(required_kind: Optional[str], candidate_experience_texts: List[str]) -> dict:
@@ -46,6 +124,8 @@ def score_experience_kind(required_kind: Optional[str], candidate_experience_tex
     Evaluate the type or domain of experience required by the job against
     the candidate's past experience using lexical and semantic similarity.
 
+    Deprecated: prefer score_experience_kinds_batch, which scores all required kinds at once.
+
     Args:
         required_kind: Description of one experience type required by the job
         candidate_experience_texts: List of candidate experience descriptions
@@ -59,30 +139,7 @@ def score_experience_kind(required_kind: Optional[str], candidate_experience_tex
         }
     """
     try:
-        if not required_kind or not required_kind.strip():
-            return {"ad_kind": None, "candidate_matching_text": candidate_experience_texts[0], "score": 70.0, "similarity": 0.0}
-        if not candidate_experience_texts:
-            return {"ad_kind": required_kind, "candidate_matching_text": None, "score": 30.0, "similarity": 0.0}
-        if required_kind in candidate_experience_texts:
-            return {"ad_kind": required_kind, "candidate_matching_text": required_kind, "score": 100.0, "similarity": 1.0}
-
-        req = _norm(required_kind)
-        cands_norm = [_norm(t) for t in candidate_experience_texts]
-        req_embed = embed_model.encode(req, normalize_embeddings=True)
-        cands_embed = embed_model.encode(cands_norm, normalize_embeddings=True)
-
-        sims = embed_model.similarity(req_embed, cands_embed)
-        max_sim_idx = int(np.argmax(sims))
-        max_sim_val = float(sims[0][max_sim_idx].numpy())
-        best_text = candidate_experience_texts[max_sim_idx] if max_sim_idx is not None else None
-
-        # map similarity to score
-        if max_sim_val >= THRESHOLDS.experience_match_score:
-            score = 100.0
-        else:
-            score = max_sim_val*100
-
-        return {"ad_required_kind": required_kind, "candidate_matching_text": best_text, "score": score, "similarity": float(max_sim_val)}
+        return score_experience_kinds_batch([required_kind], candidate_experience_texts)[0]
     except Exception as e:
         print("experience", e)
 
@@ -104,5 +161,5 @@ def combine_experience_scores(years_score: float, kind_score: float) -> dict:
             "combined_score": float (0–100)
         }
     """
-    combined = (years_score * WEIGHTS.experience_years) + (kind_score * WEIGHTS.experience_kind)
+    combined = _EXPERIENCE_W @ np.array([years_score, kind_score], dtype=np.float64)
     return {"years_score": years_score, "kind_score": kind_score, "combined_score": float(round(combined, 2))}
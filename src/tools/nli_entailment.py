@@ -1,12 +1,14 @@
 """
-Tool definition for Dates parsing and duration calculation
+Tool definition for NLI entailment checks
 """
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, List, Tuple
 import torch
 import logging
+from pydantic_ai import ModelRetry
 
+from src.config import NLIModel
 from src.utils.embedding_model import nli_model as model, nli_tokeniser as tokeniser
 
 
@@ -15,8 +17,83 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
 )
 
+# Model label order: ['contradiction', 'entailment', 'neutral']
+ENTAILMENT_IDX = 1
+
+
+def nli_entailment_batch(pairs: List[Tuple[str, str]]) -> List[float]:
+    """
+    Entailment probability for each (claim, evidence) pair, scored in batches.
+
+    Args:
+        pairs: (claim, evidence) pairs
+
+    Returns:
+        Entailment probability (0.0-1.0) per pair, in input order
+    """
+    if not pairs:
+        return []
+
+    # Tokenise unpadded, then batch by length so each batch pads only to a similar length
+    encoded = tokeniser(
+        [evidence for _, evidence in pairs],
+        [claim for claim, _ in pairs],
+        truncation=True,
+        max_length=NLIModel.max_length
+    )
+    order = sorted(range(len(pairs)), key=lambda i: len(encoded["input_ids"][i]))
+
+    scores = [0.0] * len(pairs)
+    with torch.inference_mode():
+        for start in range(0, len(order), NLIModel.batch_size):
+            idx = order[start:start + NLIModel.batch_size]
+            batch = tokeniser.pad(
+                {k: [encoded[k][i] for i in idx] for k in encoded.keys()},
+                return_tensors="pt"
+            )
+            batch = {k: v.to(model.device, non_blocking=True) for k, v in batch.items()}
+            logits = model(**batch).logits
+            probs = torch.softmax(logits, dim=-1)[:, ENTAILMENT_IDX].tolist()
+            # Scatter back to input order
+            for i, p in zip(idx, probs):
+                scores[i] = p
+
+    return scores
+
+
+def nli_entailment_batch_tool(claims: List[str], evidences: List[str]) -> List[Dict[str, float]]:
+    """
+    Args:
+        claims: Short factual statements (e.g. "Candidate has skill python")
+        evidences: Exact text snippet supporting each claim, same order as claims
+
+    Returns:
+        One entry per claim, in order:
+        [{
+            "claim": str,
+            "entailment_score": float between 0 and 100
+        }]
+    """
+    # A silent zip would drop unpaired claims - send the mismatch back to the model to retry
+    if len(claims) != len(evidences):
+        raise ModelRetry(
+            f"claims and evidences must be the same length (got {len(claims)} claims, {len(evidences)} evidences)"
+        )
+    try:
+        scores = nli_entailment_batch(list(zip(claims, evidences)))
+        return [
+            {"claim": claim, "entailment_score": round(score, 2) * 100}
+            for claim, score in zip(claims, scores)
+        ]
+    except Exception as e:
+        print(e)
+        return None
+
+
 def nli_entailment_tool(claim: str, evidence: str)-> Dict[str, float]:
     """
+    Deprecated: prefer nli_entailment_batch_tool, which scores all claims in one call.
+
     Args:
         claim: Short factual statement (e.g. "Candidate has skill python")
         evidence: Exact text snippet
@@ -27,19 +104,8 @@ def nli_entailment_tool(claim: str, evidence: str)-> Dict[str, float]:
         }
     """
     try:
-        features = tokeniser(evidence, claim,  padding=True, truncation=True, return_tensors="pt")
-        model.eval()
-        with torch.no_grad():
-            scores = model(**features).logits
-            probs = torch.softmax(scores, dim=-1)
-        label_mapping = ['contradiction', 'entailment', 'neutral']
-        entailment = 0.0
-        for item in probs:
-                entailment = round(float(item[1]), 2)
-
+        entailment = round(nli_entailment_batch([(claim, evidence)])[0], 2)
         return {"entailment_score": entailment*100}
     except Exception as e:
         print(e)
         return None
-
-    
\ No newline at end of file
@@ -1,8 +1,18 @@
 """
 Tool definition for computing overall score across multiple parameters
 """
+import numpy as np
 from src.config import WEIGHTS
 
+# Weights packed once at import, in compute_overall_fit_score argument order
+_W = np.array([
+    WEIGHTS.required_skills,
+    WEIGHTS.prefered_skills,
+    WEIGHTS.experience,
+    WEIGHTS.qualification,
+    WEIGHTS.seniority,
+], dtype=np.float64)
+
 def compute_overall_fit_score(required_skill_score: float,
                               prefered_skill_score: float,
                               experience_score: float,
@@ -23,13 +33,13 @@ def compute_overall_fit_score(required_skill_score: float,
             "overall_fit_score": float (0–100)
         }
     """
-    overall = (
-        required_skill_score * WEIGHTS.required_skills
-        + prefered_skill_score * WEIGHTS.prefered_skills
-        + experience_score * WEIGHTS.experience
-        + qualification_score * WEIGHTS.qualification
-        + seniority_score * WEIGHTS.seniority
-    )
+    overall = float(_W @ np.array([
+        required_skill_score,
+        prefered_skill_score,
+        experience_score,
+        qualification_score,
+        seniority_score,
+    ], dtype=np.float64))
     return {
         "overall_fit_score": round(overall, 2)
     }
\ No newline at end of file
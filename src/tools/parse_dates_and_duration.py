@@ -3,10 +3,32 @@ Tool definition for Dates parsing and duration calculation
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from datetime import datetime
 from dateutil import parser
 
+# Common resume date formats - tried with strptime before the (much slower) generic dateutil parser
+_FORMATS = ("%b %Y", "%B %Y", "%Y-%m", "%Y/%m", "%m/%Y", "%Y")
+_PRESENT = frozenset(("present", "current", "now"))
+# Fills missing day/month for dateutil
+_DEFAULT = datetime(1900, 1, 1)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_str(d: str) -> Optional[datetime]:
+    """Parse a non-"present" date string - fixed formats first, dateutil as fallback."""
+    d_strip = d.strip()
+    for fmt in _FORMATS:
+        try:
+            return datetime.strptime(d_strip, fmt)
+        except ValueError:
+            continue
+    try:
+        return parser.parse(d, default=_DEFAULT)
+    except Exception:
+        return None
+
 def parse_dates_and_duration(
     start_date: Optional[str],
     end_date: Optional[str]
@@ -33,12 +55,9 @@ def parse_dates_and_duration(
         if not d:
             return None
         d_clean = d.strip().lower()
-        if d_clean in {"present", "current", "now"}:
+        if d_clean in _PRESENT:
             return datetime.now()
-        try:
-            return parser.parse(d, default=datetime(1900, 1, 1))
-        except Exception:
-            return None
+        return _parse_date_str(d)
 
     start = _parse(start_date)
     end = _parse(end_date)
@@ -51,7 +70,8 @@ def parse_dates_and_duration(
             "note": "Could not reliably compute duration from provided dates."
         }
 
-    duration_years = round((end - start).days / 365, 2)
+    # Average year length - no drift across leap years
+    duration_years = round((end - start).days / 365.25, 2)
 
     return {
         "start_date_parsed": start.isoformat(),
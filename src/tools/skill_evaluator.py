@@ -1,15 +1,93 @@
 """
 Tool definition for skills matching
 """
-import re
+import asyncio
 import numpy as np
-from typing import List, Dict
-from src.utils.embedding_model import embed_model
+from typing import List, Dict, Optional
+from src.utils.embedding_cache import encode_cached, normalise_text
 from src.config import THRESHOLDS
 
-def _norm(s: str) -> str:
-    """Normalisation - Basic lower case and white space normalisation"""
-    return re.sub(r"\s+", " ", s.lower().strip())
+def _classify_all(similarities: np.ndarray) -> np.ndarray:
+    """Map best semantic similarities to match | transferable | missing in one pass"""
+    return np.where(
+        similarities >= THRESHOLDS.semantic_match, "match",
+        np.where(similarities > THRESHOLDS.skill_transferable_min, "transferable", "missing")
+    )
+
+async def evaluate_skills_batch(
+    job_skills: List[str],
+    candidate_skills: List[str],
+) -> List[Dict]:
+    """
+    Evaluate ALL job skills (required or preferred) against ALL candidate skills
+    in one call using lexical and semantic similarity.
+
+    Args:
+        job_skills: All skills required (or all skills preferred) by the job description
+        candidate_skills: List of all skills extracted from the candidate resume
+
+    Returns:
+        One entry per job skill, in order:
+        [{
+            "job_skill": str,
+            "best_candidate_skill": str | None,
+            "classification": str ("match" | "transferable" | "missing"),
+            "similarity": float (0.0–1.0)
+        }]
+    """
+    job_norm = [normalise_text(s) for s in job_skills]
+    cand_norm = [normalise_text(s) for s in candidate_skills]
+
+    results: List[Optional[Dict]] = [None] * len(job_skills)
+    pending = []
+
+    # Lexical - set membership, O(1) per job skill
+    cand_set = set(cand_norm)
+    for i, norm in enumerate(job_norm):
+        if norm in cand_set:
+            results[i] = {
+                "job_skill": job_skills[i],
+                "best_candidate_skill": job_skills[i],
+                "classification": "match",
+                "similarity": 1.0,
+            }
+        else:
+            pending.append(i)
+
+    if pending and not candidate_skills:
+        for i in pending:
+            results[i] = {
+                "job_skill": job_skills[i],
+                "best_candidate_skill": None,
+                "classification": "missing",
+                "similarity": 0.0,
+            }
+        return results
+
+    # Semantic - one batched encode per side, only for texts not already cached
+    # (the same candidate skills are scored for required and preferred skills)
+    if pending:
+        # Encodes run in worker threads (torch releases the GIL) - keeps the agent's event loop free
+        job_skill_embed, candidate_skill_embed = await asyncio.gather(
+            asyncio.to_thread(encode_cached, [job_norm[i] for i in pending]),
+            asyncio.to_thread(encode_cached, cand_norm),
+        )
+
+        # Normalised embeddings - cosine similarity is a dot product
+        sims = job_skill_embed @ candidate_skill_embed.T
+        best_idx = sims.argmax(axis=1)
+        best_val = sims[np.arange(len(pending)), best_idx]
+        labels = _classify_all(best_val)
+        best_val = np.where(labels == "missing", 0.0, best_val)
+        for i, max_sim_idx, label, max_sim_val in zip(pending, best_idx.tolist(), labels.tolist(), best_val.tolist()):
+            results[i] = {
+                "job_skill": job_skills[i],
+                "best_candidate_skill": candidate_skills[max_sim_idx],
+                "classification": label,
+                "similarity": max_sim_val,
+            }
+
+    return results
 
 async def evaluate_single_skill(
     job_skill: str,
@@ -19,6 +97,8 @@ async def evaluate_single_skill(
     Evaluate a single job-required skill against all candidate skills using
     lexical and semantic similarity.
 
+    Deprecated: prefer evaluate_skills_batch, which encodes all skills at once.
+
     Args:
         job_skill: One skill explicitly required or preferred by the job description
         candidate_skills: List of all skills extracted from the candidate resume
@@ -31,47 +111,5 @@ async def evaluate_single_skill(
             "similarity": float (0.0–1.0)
         }
     """
-    job_norm = _norm(job_skill)
-    cand_norm = [_norm(s) for s in candidate_skills]
-
-    # Lexical
-    if job_norm in cand_norm:
-        return {
-            "job_skill": job_skill,
-            "best_candidate_skill": job_skill,
-            "classification": "match",
-            "similarity": 1.0,
-        }
-
-    # Semantic
-    job_skill_embed = embed_model.encode(job_norm, normalize_embeddings=True)
-    candidate_skill_embed = embed_model.encode(cand_norm, normalize_embeddings=True)
-
-    sims = embed_model.similarity(job_skill_embed, candidate_skill_embed)
-    max_sim_idx = int(np.argmax(sims))
-    max_sim_val = float(sims[0][max_sim_idx].numpy())
-
-    # Semantic match
-    if max_sim_val>=THRESHOLDS.semantic_match:
-        return {
-            "job_skill": job_skill,
-            "best_candidate_skill": candidate_skills[max_sim_idx],
-            "classification": "match",
-            "similarity": max_sim_val,
-        }
-    # Transferable skill match
-    elif (max_sim_val>THRESHOLDS.skill_transferable_min) and (max_sim_val<THRESHOLDS.semantic_match):
-        return {
-            "job_skill": job_skill,
-            "best_candidate_skill": candidate_skills[max_sim_idx],
-            "classification": "transferable",
-            "similarity": max_sim_val,
-        }
-    # Missing
-    else:
-        return {
-            "job_skill": job_skill,
-            "best_candidate_skill": candidate_skills[max_sim_idx],
-            "classification": "missing",
-            "similarity": 0,
-        }
\ No newline at end of file
+    results = await evaluate_skills_batch([job_skill], candidate_skills)
+    return results[0]
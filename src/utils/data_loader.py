@@ -3,18 +3,34 @@ Read PDF, HTML and URLs into text
 """
 import pymupdf 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from pathlib import Path
 
+# Shared session - keep-alive and connection pooling across URL loads
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "python-etl/1.0"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+
+def _html_to_text(html: str) -> str:
+    """
+    Extract visible text from HTML using the lxml (C) parser.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    # Script/style bodies aren't visible text
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+    return soup.get_text(separator=" ")
+
+
 def load_pdf(path: str) -> str:
     """
     Load and extract text from a PDF file using PyMuPDF.
     """
-    text = ""
     with pymupdf.open(path) as doc:
-        for page in doc:
-            text += page.get_text().replace("\u200b", "")
-    return text
+        return "".join(page.get_text() for page in doc).replace("\u200b", "")
 
 def load_html(path: str) -> str:
     """
@@ -22,16 +38,14 @@ def load_html(path: str) -> str:
     """
 
     html = Path(path).read_text(encoding="utf-8")
-    soup = BeautifulSoup(html, "html.parser")
-    return soup.get_text(separator=" ")
+    return _html_to_text(html)
 
 def load_url(url: str) -> str:
     """
     Fetch HTML from a URL and extract visible text.
     """
-    resp = requests.get(url, headers={"User-Agent": "python-etl/1.0"})
-    soup = BeautifulSoup(resp.text, "html.parser")
-    return soup.get_text(separator=" ")
+    resp = _SESSION.get(url, timeout=10)
+    return _html_to_text(resp.text)
 
 def load_text_file(path: str) -> str:
     """
@@ -0,0 +1,54 @@
+"""
+In-memory LRU cache of sentence embeddings keyed by normalised text
+"""
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List
+import numpy as np
+import torch
+from src.utils.embedding_model import embed_model
+from src.config import CACHE
+
+_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def normalise_text(s: str) -> str:
+    """
+    Lower case and collapse whitespace - the key every evaluator embeds and compares by.
+    Memoised: tool calls repeat the same candidate entries for every ad requirement.
+    """
+    # split() with no args splits on runs of any whitespace - same as \s+, no regex engine
+    return " ".join(s.lower().split())
+
+
+def encode_cached(texts: List[str]) -> np.ndarray:
+    """
+    L2-normalised embeddings for texts, one row per text in input order.
+    Only cache misses are encoded - together, in one batched call.
+
+    Args:
+        texts: Normalised texts to embed
+
+    Returns:
+        np.ndarray of shape (len(texts), dim)
+    """
+    with _lock:
+        found: Dict[str, np.ndarray] = {t: _cache[t] for t in texts if t in _cache}
+        for t in found:
+            _cache.move_to_end(t)
+
+    missing = [t for t in dict.fromkeys(texts) if t not in found]
+    if missing:
+        with torch.inference_mode():
+            embeds = embed_model.encode(missing, batch_size=64, normalize_embeddings=True, convert_to_numpy=True)
+        found.update(zip(missing, embeds))
+        with _lock:
+            for t, e in zip(missing, embeds):
+                _cache[t] = e
+            while len(_cache) > CACHE.embedding_entries:
+                _cache.popitem(last=False)
+
+    return np.stack([found[t] for t in texts])
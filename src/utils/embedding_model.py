@@ -1,12 +1,106 @@
 """
 Embedding models initialisation for use in agentic tools
+
+Models are loaded on first use rather than at import, so importing the agents
+(and the Streamlit app) doesn't pay the torch / transformer load up front.
 """
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-import torch
+import threading
 from src.config import NLIModel, EMBEDModel
-from sentence_transformers import SentenceTransformer
 
-nli_model = AutoModelForSequenceClassification.from_pretrained(NLIModel.name, dtype=torch.float32, low_cpu_mem_usage=False)
-nli_tokeniser = AutoTokenizer.from_pretrained(NLIModel.name, use_fast=True)
 
-embed_model = SentenceTransformer(EMBEDModel.name)
+class LazyModel:
+    """
+    Proxy that loads the wrapped model on first attribute access or call.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._model = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Load the model once (thread-safe) and return it."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = self._loader()
+        return self._model
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+
+def _device() -> str:
+    """CUDA when available, else CPU - resolved once per loader."""
+    import torch
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+def _dtype(bfloat16: bool):
+    import torch
+    return torch.bfloat16 if bfloat16 else torch.float32
+
+def _load_nli_model():
+    import torch
+    from transformers import AutoModelForSequenceClassification
+    # Inference only - switch to eval mode once here rather than per call
+    model = AutoModelForSequenceClassification.from_pretrained(
+        NLIModel.name, dtype=_dtype(NLIModel.bfloat16), low_cpu_mem_usage=True
+    ).to(_device()).eval()
+    if NLIModel.compile:
+        # Compile forward in place so callers still see the HF model (.device, .config);
+        # batch shapes vary with pair length, so compile for dynamic shapes
+        model.forward = torch.compile(model.forward, dynamic=True)
+    return model
+
+def _load_nli_tokeniser():
+    from transformers import AutoTokenizer
+    return AutoTokenizer.from_pretrained(NLIModel.name, use_fast=True)
+
+def _load_embed_model():
+    import torch
+    from sentence_transformers import SentenceTransformer
+    # INT8 quantisation needs FP32 weights to start from
+    bfloat16 = EMBEDModel.bfloat16 and not EMBEDModel.quantize_int8
+    model = SentenceTransformer(EMBEDModel.name, device=_device(), model_kwargs={"dtype": _dtype(bfloat16)})
+    # Dynamic quantisation has CPU kernels only
+    if EMBEDModel.quantize_int8 and model.device.type == "cpu":
+        # INT8 weights for nn.Linear in the transformer module - VNNI / qnnpack int8 matmuls
+        model[0].auto_model = torch.ao.quantization.quantize_dynamic(
+            model[0].auto_model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return model
+
+
+nli_model = LazyModel(_load_nli_model)
+nli_tokeniser = LazyModel(_load_nli_tokeniser)
+
+embed_model = LazyModel(_load_embed_model)
+
+
+def _warm_up():
+    nli_tokeniser.load()
+    nli_model.load()
+    if NLIModel.compile:
+        # First forward pass triggers compilation - pay it here rather than in a tool call
+        import torch
+        features = nli_tokeniser("warm up", "warm up", return_tensors="pt").to(nli_model.device)
+        with torch.inference_mode():
+            nli_model(**features)
+    # One tiny encode so first real tool call doesn't pay lazy kernel / tokeniser init
+    embed_model.encode("warm up", normalize_embeddings=True)
+
+
+_warm_up_thread = None
+
+def warm_up_models() -> None:
+    """
+    Load the NLI and embedding models in a background thread (once per process),
+    so the first tool call doesn't stall on model loading.
+    """
+    global _warm_up_thread
+    if _warm_up_thread is None:
+        _warm_up_thread = threading.Thread(target=_warm_up, name="model-warm-up", daemon=True)
+        _warm_up_thread.start()
@@ -0,0 +1,79 @@
+"""
+Shared LLM client initialisation for use in agents
+"""
+import asyncio
+import atexit
+import weakref
+import httpx
+from dotenv import load_dotenv
+from pydantic_ai.models import Model, infer_model
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.openai import OpenAIProvider
+from src.config import ModelConfig, HTTP_CLIENT
+
+load_dotenv()
+
+
+class _PerLoopTransport(httpx.AsyncBaseTransport):
+    """
+    Connection pool per event loop.
+    Pooled (HTTP/2) connections are bound to the loop that opened them, and each Streamlit
+    session runs its own loop - so sessions keep separate pools instead of sharing sockets.
+    """
+
+    def __init__(self, **transport_kwargs):
+        self._transport_kwargs = transport_kwargs
+        # loop -> transport, dropped with the loop when its session ends
+        self._transports = weakref.WeakKeyDictionary()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            transport = self._transports[loop] = httpx.AsyncHTTPTransport(**self._transport_kwargs)
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        transports = list(self._transports.values())
+        self._transports.clear()
+        for transport in transports:
+            try:
+                await transport.aclose()
+            except Exception:
+                # Pool belongs to another (possibly closed) loop - the OS reclaims its sockets
+                pass
+
+
+# One client for all agents - keepalive + HTTP/2 multiplexing across requests on the same loop
+http_client = httpx.AsyncClient(
+    timeout=HTTP_CLIENT.timeout,
+    transport=_PerLoopTransport(
+        http2=HTTP_CLIENT.http2,
+        limits=httpx.Limits(
+            max_connections=HTTP_CLIENT.max_connections,
+            max_keepalive_connections=HTTP_CLIENT.max_keepalive_connections,
+        ),
+    ),
+)
+openai_provider = OpenAIProvider(http_client=http_client)
+
+
+def build_model(model: ModelConfig) -> Model:
+    """
+    Build the model for a registry entry ("<provider>:<model name>").
+    OpenAI models use the shared pooled client; other providers are resolved by Pydantic AI.
+    """
+    provider, sep, model_name = model.name.partition(":")
+    if sep and provider == "openai":
+        return OpenAIChatModel(model_name, provider=openai_provider)
+    return infer_model(model.name)
+
+
+def _close_http_client():
+    """Close pooled connections on interpreter exit."""
+    try:
+        asyncio.run(http_client.aclose())
+    except RuntimeError:
+        pass
+
+atexit.register(_close_http_client)
@@ -0,0 +1,41 @@
+"""
+Disk cache for parsed documents, keyed by SHA-256 of the source text
+"""
+import functools
+import hashlib
+from diskcache import Cache
+from pydantic import TypeAdapter
+from src.config import LLM_MODELS, CACHE
+
+parse_cache = Cache(CACHE.directory)
+
+
+def cache_parsed(agent_key: str, adapter: TypeAdapter, id_field: str):
+    """
+    Memoise an async `parse(text, id)` agent call on (agent, prompt version, model, text hash).
+
+    Args:
+        agent_key: LLM_MODELS registry key of the parsing agent
+        adapter: Module-level TypeAdapter of the model returned by the parser
+        id_field: Output field holding the caller supplied ID, patched on cache hits
+    """
+    model = LLM_MODELS[agent_key]
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(text: str, entity_id: str):
+            key = (agent_key, model.prompt_version, model.name, hashlib.sha256(text.encode()).hexdigest())
+
+            cached = parse_cache.get(key)
+            if cached is not None:
+                result = adapter.validate_json(cached)
+                setattr(result, id_field, entity_id)
+                return result
+
+            result = await func(text, entity_id)
+            parse_cache.set(key, adapter.dump_json(result), expire=CACHE.parse_ttl_seconds)
+            return result
+
+        return wrapper
+
+    return decorator
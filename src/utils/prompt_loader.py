@@ -0,0 +1,44 @@
+"""
+Load version-controlled prompts from src/prompts/<version>/
+"""
+from functools import lru_cache
+from pathlib import Path
+from src.config import LLM_MODELS
+
+PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+
+# LLM_MODELS key -> prompt file
+PROMPT_FILES = {
+    "resume_parser": "resume_parser_prompt.txt",
+    "job_parser": "job_parser_prompt.txt",
+    "matcher": "fit_analyser_prompt.txt",
+    "summary": "summariser_prompt.txt",
+}
+
+
+@lru_cache(maxsize=None)
+def load_prompt(version: str, name: str) -> str:
+    """
+    Read a prompt file once per process.
+
+    Args:
+        version: Prompt version directory, e.g. "v1"
+        name: Prompt file name, e.g. "resume_parser_prompt.txt"
+
+    Returns:
+        Prompt text
+    """
+    return (PROMPTS_DIR / version / name).read_text()
+
+
+def load_agent_prompt(agent_key: str) -> str:
+    """
+    Load an agent's prompt at the prompt version configured for it in LLM_MODELS.
+
+    Args:
+        agent_key: LLM_MODELS registry key, e.g. "job_parser"
+
+    Returns:
+        Prompt text
+    """
+    return load_prompt(LLM_MODELS[agent_key].prompt_version, PROMPT_FILES[agent_key])